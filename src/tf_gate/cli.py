@@ -3,31 +3,39 @@
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
 
-from tf_gate.phases.phase1_ingest import ingest_plan
-from tf_gate.phases.phase2_opa import run_phase2_validation
-from tf_gate.phases.phase3_context import run_phase3_context_analysis
-from tf_gate.phases.phase4_intent import run_phase4_intent_validation
-from tf_gate.utils.blast_radius import BlastRadiusLevel
-from tf_gate.utils.config import load_config
-from tf_gate.utils.git import get_latest_commit_message
-from tf_gate.utils.opa import get_default_policy_dir
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+# Phase modules and rich are imported lazily inside the commands that use
+# them, so `tf-gate --help` / `tf-gate version` don't pay for the whole
+# pipeline's import graph.
+_CONSOLE: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """Return the shared rich Console, importing rich on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+
+        _CONSOLE = Console()
+    return _CONSOLE
 
 
 class BreakGlassContext:
     """Context object for break glass mode."""
 
+    __slots__ = ("break_glass", "break_glass_reason", "shadow_mode", "config")
+
     def __init__(self):
         self.break_glass = False
         self.break_glass_reason: Optional[str] = None
         self.shadow_mode = False
+        self.config = None
 
 
 @click.group()
@@ -57,6 +65,8 @@ def cli(
     A multi-layered defense system that gates terraform apply behind
     contextual safety checks, semantic validation, and policy-as-code guardrails.
     """
+    from tf_gate.utils.config import load_config
+
     ctx.ensure_object(BreakGlassContext)
     ctx.obj.break_glass = break_glass is not None
     ctx.obj.break_glass_reason = break_glass
@@ -91,6 +101,11 @@ def cli(
     is_flag=True,
     help="Generate detailed impact report for tech managers (requires --use-llm)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Skip the content-addressed ingest cache and re-parse the plan",
+)
 @click.pass_context
 def validate(
     ctx: click.Context,
@@ -99,13 +114,61 @@ def validate(
     terraform_dir: str,
     use_llm: bool,
     generate_report: bool,
+    no_cache: bool,
 ) -> int:
     """Validate a Terraform plan through all 4 phases.
 
     PLAN_FILE is the path to the Terraform plan JSON file.
     If not provided, will look for tfplan.json in the current directory.
     """
-    break_glass_ctx = ctx.obj
+    return _run_validation(
+        ctx.obj,
+        plan_file=plan_file,
+        policy_dir=policy_dir,
+        terraform_dir=terraform_dir,
+        use_llm=use_llm,
+        generate_report=generate_report,
+        no_cache=no_cache,
+    )
+
+
+def _run_validation(
+    break_glass_ctx: BreakGlassContext,
+    plan_file: Optional[str] = None,
+    policy_dir: Optional[str] = None,
+    terraform_dir: str = ".",
+    use_llm: bool = False,
+    generate_report: bool = False,
+    no_cache: bool = False,
+) -> int:
+    """Run the 4-phase validation pipeline and return its exit code.
+
+    Shared by the validate and apply commands; apply calls this directly
+    instead of re-dispatching through click's ctx.invoke machinery.
+
+    Args:
+        break_glass_ctx: Break glass context carrying config and flags.
+        plan_file: Path to the plan JSON file, or None for tfplan.json.
+        policy_dir: Rego policy directory, or None for the configured one.
+        terraform_dir: Directory containing the Terraform configuration.
+        use_llm: Enable LLM-based intent validation.
+        generate_report: Generate the LLM impact report.
+        no_cache: Skip the content-addressed ingest cache.
+
+    Returns:
+        0 when apply is allowed, 1 when blocked, 42 for break glass.
+    """
+    from rich.panel import Panel
+
+    from tf_gate.phases.phase1_ingest import ingest_plan
+    from tf_gate.phases.phase2_opa import run_phase2_validation
+    from tf_gate.phases.phase3_context import run_phase3_context_analysis
+    from tf_gate.phases.phase4_intent import run_phase4_intent_validation
+    from tf_gate.utils.blast_radius import BlastRadiusLevel
+    from tf_gate.utils.git import get_latest_commit_message
+    from tf_gate.utils.opa import get_default_policy_dir
+
+    console = _get_console()
     config = break_glass_ctx.config
 
     # Determine plan file path
@@ -136,6 +199,7 @@ def validate(
         changes, blast_radius, metadata = ingest_plan(
             plan_path,
             thresholds=config.get("blast_radius.thresholds"),
+            use_cache=not no_cache,
         )
         console.print(f"   Total resources: {blast_radius.total_resources}")
         console.print(
@@ -149,17 +213,32 @@ def validate(
         console.print(f"   {level_emoji} Blast Radius Level: {blast_radius.level.value.upper()}")
 
         if blast_radius.critical_resources:
-            console.print("   [red]⚠️  Critical resources affected:[/red]")
-            for resource in blast_radius.critical_resources:
-                console.print(f"      - {resource}")
+            # Long lists render as a single print; rich's markup parse and
+            # stdout flush per call add up on large plans
+            console.print(
+                "   [red]⚠️  Critical resources affected:[/red]\n"
+                + "\n".join(f"      - {resource}" for resource in blast_radius.critical_resources)
+            )
     except Exception as e:
         console.print(f"[red]Phase 1 Failed: {e}[/red]")
         return 1
 
-    # Phase 2: Policy Validation
-    console.print("\n[bold]Phase 2: Policy Validation (OPA)[/bold]")
-    try:
-        validation_results = run_phase2_validation(
+    # Phases 2-4 have no data dependencies on each other once ingestion has
+    # run, and each is dominated by external latency (OPA subprocess,
+    # terraform/git subprocesses, LLM HTTP). Compute them concurrently and
+    # render the sections in order afterwards.
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tf_gate.phases.phase3_context import DriftResult, RiskLevel
+
+    commit_msg = get_latest_commit_message(Path(terraform_dir))
+    # Enable LLM if --use-llm flag is passed OR if enabled in config
+    use_llm_enabled = use_llm or config.get("phases.phase_4_intent.enabled", False)
+    llm_provider = config.get("phases.phase_4_intent.provider", "lmstudio")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        phase2_future = executor.submit(
+            run_phase2_validation,
             policy_dir=policy_dir_path,
             resource_changes=changes,
             blast_radius=blast_radius,
@@ -167,21 +246,47 @@ def validate(
             strict_mode=config.get("opa.strict_mode", True),
             emergency_override=break_glass_ctx.break_glass,
         )
+        phase3_future = executor.submit(
+            run_phase3_context_analysis,
+            terraform_dir=Path(terraform_dir),
+            plan_resources=changes,
+            terraform_version=metadata.get("terraform_version", "unknown"),
+            base_risk=RiskLevel.LOW,
+            friday_cutoff_hour=config.get("phases.phase_3_time_gating.friday_cutoff_hour", 15),
+            weekend_blocking=config.get("phases.phase_3_time_gating.weekend_blocking", True),
+        )
+        phase4_future = None
+        if commit_msg:
+            phase4_future = executor.submit(
+                run_phase4_intent_validation,
+                commit_message=commit_msg,
+                resource_changes=changes,
+                use_llm=use_llm_enabled,
+                llm_provider=llm_provider,
+                generate_report=generate_report,
+            )
+
+    # Phase 2: Policy Validation
+    console.print("\n[bold]Phase 2: Policy Validation (OPA)[/bold]")
+    try:
+        validation_results = phase2_future.result()
 
         deny_count = len(validation_results.get("deny", []))
         warn_count = len(validation_results.get("warn", []))
 
         if deny_count > 0:
-            console.print(f"   [red]❌ {deny_count} policy violations (deny)[/red]")
-            for msg in validation_results["deny"]:
-                console.print(f"      - {msg}")
+            console.print(
+                f"   [red]❌ {deny_count} policy violations (deny)[/red]\n"
+                + "\n".join(f"      - {msg}" for msg in validation_results["deny"])
+            )
         else:
             console.print("   [green]✅ No policy violations[/green]")
 
         if warn_count > 0:
-            console.print(f"   [yellow]⚠️  {warn_count} warnings[/yellow]")
-            for msg in validation_results["warn"]:
-                console.print(f"      - {msg}")
+            console.print(
+                f"   [yellow]⚠️  {warn_count} warnings[/yellow]\n"
+                + "\n".join(f"      - {msg}" for msg in validation_results["warn"])
+            )
     except Exception as e:
         console.print(f"[red]Phase 2 Failed: {e}[/red]")
         return 1
@@ -190,16 +295,7 @@ def validate(
     console.print("\n[bold]Phase 3: Context Analysis[/bold]")
     context_results = {}
     try:
-        from tf_gate.phases.phase3_context import DriftResult, RiskLevel
-
-        context_results = run_phase3_context_analysis(
-            terraform_dir=Path(terraform_dir),
-            plan_resources=changes,
-            terraform_version=metadata.get("terraform_version", "unknown"),
-            base_risk=RiskLevel.LOW,
-            friday_cutoff_hour=config.get("phases.phase_3_time_gating.friday_cutoff_hour", 15),
-            weekend_blocking=config.get("phases.phase_3_time_gating.weekend_blocking", True),
-        )
+        context_results = phase3_future.result()
 
         temporal = context_results["temporal_context"]
         drift = context_results["drift_result"]
@@ -230,8 +326,6 @@ def validate(
     except Exception as e:
         console.print(f"[yellow]Phase 3 Warning: {e}[/yellow]")
         # Initialize with empty drift result to avoid errors later
-        from tf_gate.phases.phase3_context import DriftResult
-
         context_results = {
             "drift_result": DriftResult(
                 has_drift=False, drifted_resources=[], conflict_resources=[]
@@ -241,25 +335,13 @@ def validate(
     # Phase 4: Intent Validation
     console.print("\n[bold]Phase 4: Intent Validation[/bold]")
     try:
-        commit_msg = get_latest_commit_message(Path(terraform_dir))
-
-        if commit_msg:
-            # Enable LLM if --use-llm flag is passed OR if enabled in config
-            use_llm_enabled = use_llm or config.get("phases.phase_4_intent.enabled", False)
-            llm_provider = config.get("phases.phase_4_intent.provider", "lmstudio")
-
+        if phase4_future is not None:
             if use_llm_enabled:
                 console.print("   [dim]🤖 Using LLM for intent validation...[/dim]")
                 if generate_report:
                     console.print("   [dim]📋 Generating impact report...[/dim]")
 
-            intent_result = run_phase4_intent_validation(
-                commit_message=commit_msg,
-                resource_changes=changes,
-                use_llm=use_llm_enabled,
-                llm_provider=llm_provider,
-                generate_report=generate_report,
-            )
+            intent_result = phase4_future.result()
 
             if intent_result.aligned:
                 console.print("   [green]✅ Intent aligned with changes[/green]")
@@ -321,20 +403,21 @@ def validate(
     # Handle shadow mode
     if break_glass_ctx.shadow_mode:
         if should_block:
-            console.print("[yellow]🎭 SHADOW MODE: Would have blocked for:[/yellow]")
-            for reason in reasons:
-                console.print(f"   - {reason}")
+            console.print(
+                "[yellow]🎭 SHADOW MODE: Would have blocked for:[/yellow]\n"
+                + "\n".join(f"   - {reason}" for reason in reasons)
+            )
         else:
             console.print("[green]✅ SHADOW MODE: Would allow apply[/green]")
         return 0
 
     # Normal decision
     if should_block:
-        console.print("[red]❌ VALIDATION FAILED - Apply Blocked[/red]")
-        console.print("[red]Reasons:[/red]")
-        for reason in reasons:
-            console.print(f"   - {reason}")
-        console.print("\n[yellow]Use --break-glass=INCIDENT-XXX to bypass in emergencies[/yellow]")
+        console.print(
+            "[red]❌ VALIDATION FAILED - Apply Blocked[/red]\n[red]Reasons:[/red]\n"
+            + "\n".join(f"   - {reason}" for reason in reasons)
+            + "\n\n[yellow]Use --break-glass=INCIDENT-XXX to bypass in emergencies[/yellow]"
+        )
         return 1
 
     console.print("[green]✅ All 4 phases passed - Apply allowed[/green]")
@@ -351,8 +434,10 @@ def validate(
 @click.pass_context
 def apply(ctx: click.Context, plan_file: Optional[str], auto_approve: bool) -> int:
     """Run validation and apply Terraform plan if validation passes."""
+    console = _get_console()
+
     # First run validation
-    validate_result = ctx.invoke(validate, plan_file=plan_file)
+    validate_result = _run_validation(ctx.obj, plan_file=plan_file)
 
     if validate_result != 0:
         console.print("\n[red]❌ Validation failed - not proceeding with apply[/red]")
@@ -410,6 +495,7 @@ def plan(terraform_dir: str, out: str, json_out: str) -> int:
     This is a convenience wrapper around 'terraform plan' that also
     generates a JSON version for tf-gate validation.
     """
+    console = _get_console()
     terraform_path = Path(terraform_dir)
     plan_file = terraform_path / out
     json_file = terraform_path / json_out
@@ -428,22 +514,23 @@ def plan(terraform_dir: str, out: str, json_out: str) -> int:
             console.print("[red]terraform plan failed[/red]")
             return result.returncode
 
-        # Convert to JSON
+        # Convert to JSON, streaming stdout straight to the file instead of
+        # buffering the whole (potentially 100MB+) document in memory
         console.print(f"Converting plan to JSON: {json_file}")
-        result = subprocess.run(
-            ["terraform", "show", "-json", str(plan_file)],
-            cwd=terraform_path,
-            capture_output=True,
-            text=True,
-        )
+        with open(json_file, "wb") as f:
+            result = subprocess.run(
+                ["terraform", "show", "-json", str(plan_file)],
+                cwd=terraform_path,
+                stdout=f,
+                stderr=subprocess.PIPE,
+            )
 
         if result.returncode == 0:
-            with open(json_file, "w") as f:
-                f.write(result.stdout)
             console.print(f"[green]✅ Plan saved to {plan_file} and {json_file}[/green]")
         else:
             console.print(
-                f"[yellow]Warning: Could not convert plan to JSON: {result.stderr}[/yellow]"
+                f"[yellow]Warning: Could not convert plan to JSON: "
+                f"{result.stderr.decode(errors='replace')}[/yellow]"
             )
 
         return 0
@@ -464,6 +551,9 @@ def init(force: bool) -> None:
 
     Creates default configuration file and policies directory.
     """
+    from tf_gate.utils.opa import get_default_policy_dir
+
+    console = _get_console()
     config_file = Path("tf-gate.yaml")
     policies_dir = Path("policies")
 
@@ -510,15 +600,29 @@ notifications:
     # Copy default policies from package
     default_policies = get_default_policy_dir()
     if default_policies.exists():
+        import os
         import shutil
 
+        # Hard links are free when both sides live on the same filesystem;
+        # otherwise copyfile uses sendfile and skips the metadata copy that
+        # copy2 would do (we don't need source timestamps on the copies)
+        same_device = policies_dir.stat().st_dev == default_policies.stat().st_dev
+
         for policy_file in default_policies.glob("*.rego"):
             dest = policies_dir / policy_file.name
             # Skip if source and dest are the same file
             if policy_file.resolve() == dest.resolve():
                 continue
             if not dest.exists() or force:
-                shutil.copy2(policy_file, dest)
+                if dest.exists():
+                    dest.unlink()
+                if same_device:
+                    try:
+                        os.link(policy_file, dest)
+                    except OSError:
+                        shutil.copyfile(policy_file, dest)
+                else:
+                    shutil.copyfile(policy_file, dest)
                 console.print(f"[green]✅ Copied {policy_file.name}[/green]")
 
     console.print("\n[bold]Initialization complete![/bold]")
@@ -534,8 +638,9 @@ notifications:
 )
 def check_policies(policy_dir: Optional[str]) -> int:
     """Check that all policies compile correctly."""
-    from tf_gate.utils.opa import OPAClient
+    from tf_gate.utils.opa import OPAClient, get_default_policy_dir
 
+    console = _get_console()
     if policy_dir is None:
         policy_path = get_default_policy_dir()
     else:
@@ -558,6 +663,7 @@ def version() -> None:
     """Show tf-gate version information."""
     from tf_gate import __version__
 
+    console = _get_console()
     console.print(f"[bold]tf-gate[/bold] version {__version__}")
 
     # Show OPA version if available
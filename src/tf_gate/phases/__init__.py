@@ -1,12 +1,18 @@
 """Phase modules for the 4-phase validation pipeline."""
 
-from tf_gate.phases.phase1_ingest import BlastRadius, PlanIngestor, ingest_plan
+from tf_gate.phases.phase1_ingest import (
+    BlastRadius,
+    PlanIngestor,
+    ingest_plan,
+    ingest_plan_data,
+)
 from tf_gate.phases.phase2_opa import PolicyValidator, run_phase2_validation
 from tf_gate.phases.phase3_context import ContextEngine, run_phase3_context_analysis
 from tf_gate.phases.phase4_intent import IntentValidator, run_phase4_intent_validation
 
 __all__ = [
     "ingest_plan",
+    "ingest_plan_data",
     "PlanIngestor",
     "BlastRadius",
     "run_phase2_validation",
@@ -6,34 +6,86 @@ This module provides:
 - Blast radius calculation based on resource changes
 """
 
-import json
+import hashlib
+import pickle
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Optional, Union
 
-import ijson
-
-from tf_gate.utils.blast_radius import BlastRadius, BlastRadiusLevel
+# Prefer the C yajl2 backend explicitly; the bare `import ijson` backend
+# autodetection can settle on the pure-Python parser, which is several
+# times slower on large plans. Same API either way.
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson.backends.yajl2_cffi as ijson  # type: ignore[no-redef]
+    except ImportError:
+        try:
+            import ijson.backends.yajl2 as ijson  # type: ignore[no-redef]
+        except ImportError:
+            import ijson  # type: ignore[no-redef]
+
+from ijson.common import ObjectBuilder
+
+from tf_gate.utils import jsonio
+from tf_gate.utils.blast_radius import (
+    CRITICAL_RESOURCE_TYPES,
+    DESTRUCTIVE_ACTIONS,
+    BlastRadius,
+    BlastRadiusLevel,
+    calculate_blast_radius,
+)
+
+
+# Top-level plan fields captured as metadata
+_META_KEYS = frozenset({"terraform_version", "format_version", "timestamp", "errored"})
+
+# On-disk cache of ingest results, content-addressed so entries never go stale
+_INGEST_CACHE_DIR = Path.home() / ".cache" / "tf-gate" / "ingest"
+
+
+def _ingest_cache_key(plan_bytes: bytes, thresholds: dict[str, int]) -> str:
+    """Build a cache key from plan content and blast radius thresholds."""
+    hasher = hashlib.blake2b(plan_bytes)
+    hasher.update(repr(sorted(thresholds.items())).encode())
+    return hasher.hexdigest()
+
+
+def _load_ingest_cache(cache_file: Path) -> Optional[tuple]:
+    """Load a cached ingest result, returning None on any failure."""
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def _store_ingest_cache(cache_file: Path, result: tuple) -> None:
+    """Persist an ingest result, ignoring write failures."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(result, f)
+    except OSError:
+        pass
 
 
 class PlanIngestor:
-    """Streaming parser for Terraform plan JSON files."""
-
-    # Resource types considered critical/stateful
-    CRITICAL_RESOURCE_TYPES = {
-        "aws_db_instance",
-        "aws_rds_cluster",
-        "aws_kms_key",
-        "aws_s3_bucket",
-        "aws_dynamodb_table",
-        "aws_elasticache_cluster",
-        "aws_redshift_cluster",
-        "aws_mq_broker",
-        "aws_docdb_cluster",
-        "aws_neptune_cluster",
-        "aws_memorydb_cluster",
-        "aws_qldb_ledger",
-    }
+    """Streaming parser for Terraform plan JSON files.
+
+    Methods take a ``Path``; callers convert string paths once at the
+    boundary (see ingest_plan) rather than re-wrapping per call.
+    """
+
+    __slots__ = ("thresholds", "streaming_threshold")
+
+    # Resource types considered critical/stateful; shared with the blast
+    # radius utilities so both paths classify identically
+    CRITICAL_RESOURCE_TYPES = CRITICAL_RESOURCE_TYPES
+
+    # Plans below this size are parsed in one shot; larger ones are streamed
+    DEFAULT_STREAMING_THRESHOLD = 256 * 1024 * 1024
 
     def __init__(self, thresholds: Optional[dict[str, int]] = None):
         """Initialize the plan ingestor.
@@ -43,8 +95,9 @@ class PlanIngestor:
                        Defaults: green=5, yellow=20, red=50
         """
         self.thresholds = thresholds or {"green": 5, "yellow": 20, "red": 50}
+        self.streaming_threshold = self.DEFAULT_STREAMING_THRESHOLD
 
-    def parse_streaming(self, plan_path: Union[str, Path]) -> Iterator[dict[str, Any]]:
+    def parse_streaming(self, plan_path: Path) -> Iterator[dict[str, Any]]:
         """Parse plan.json using streaming to handle large files.
 
         Args:
@@ -53,14 +106,12 @@ class PlanIngestor:
         Yields:
             Individual resource change objects.
         """
-        plan_path = Path(plan_path)
-
         with open(plan_path, "rb") as f:
             # Stream resource_changes array items
             for resource in ijson.items(f, "resource_changes.item"):
                 yield resource
 
-    def parse_full(self, plan_path: Union[str, Path]) -> dict[str, Any]:
+    def parse_full(self, plan_path: Path) -> dict[str, Any]:
         """Parse entire plan.json into memory (for smaller files).
 
         Args:
@@ -69,12 +120,42 @@ class PlanIngestor:
         Returns:
             Complete plan dictionary.
         """
-        plan_path = Path(plan_path)
+        return jsonio.loads(plan_path.read_bytes())
+
+    def parse_once(
+        self, plan_path: Path
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Stream the plan once, collecting resource changes and metadata.
 
-        with open(plan_path) as f:
-            return json.load(f)
+        Extracting changes and metadata separately tokenizes the whole file
+        twice; this multiplexes both over a single ijson event stream.
 
-    def extract_resource_changes(self, plan_path: Union[str, Path]) -> list[dict[str, Any]]:
+        Args:
+            plan_path: Path to the Terraform plan JSON file.
+
+        Returns:
+            Tuple of (resource_changes, metadata).
+        """
+        changes: list[dict[str, Any]] = []
+        metadata: dict[str, Any] = {}
+        builder: Optional[ObjectBuilder] = None
+
+        with open(plan_path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if builder is not None:
+                    builder.event(event, value)
+                    if event == "end_map" and prefix == "resource_changes.item":
+                        changes.append(builder.value)
+                        builder = None
+                elif event == "start_map" and prefix == "resource_changes.item":
+                    builder = ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix in _META_KEYS:
+                    metadata[prefix] = value
+
+        return changes, metadata
+
+    def extract_resource_changes(self, plan_path: Path) -> list[dict[str, Any]]:
         """Extract all resource changes from plan.
 
         Args:
@@ -83,12 +164,9 @@ class PlanIngestor:
         Returns:
             List of resource change dictionaries.
         """
-        changes = []
-        for resource in self.parse_streaming(plan_path):
-            changes.append(resource)
-        return changes
+        return list(self.parse_streaming(plan_path))
 
-    def calculate_blast_radius(self, plan_path: Union[str, Path]) -> BlastRadius:
+    def calculate_blast_radius(self, plan_path: Path) -> BlastRadius:
         """Calculate blast radius from plan file.
 
         Args:
@@ -108,8 +186,6 @@ class PlanIngestor:
             total_resources += 1
 
             actions = resource.get("change", {}).get("actions", [])
-            resource_type = resource.get("type", "")
-            address = resource.get("address", "")
 
             # Count by action type
             if "create" in actions and "delete" in actions:
@@ -121,10 +197,10 @@ class PlanIngestor:
             elif "update" in actions:
                 update_count += 1
 
-            # Track critical resources
-            if resource_type in self.CRITICAL_RESOURCE_TYPES:
-                if any(a in actions for a in ["delete", "replace"]):
-                    critical_resources.append(address)
+            # Track critical resources; only resolve the address when needed
+            if resource.get("type", "") in self.CRITICAL_RESOURCE_TYPES:
+                if not DESTRUCTIVE_ACTIONS.isdisjoint(actions):
+                    critical_resources.append(resource.get("address", ""))
 
         # Determine level
         destructive_count = delete_count + replace_count
@@ -150,7 +226,23 @@ class PlanIngestor:
             critical_resources=critical_resources,
         )
 
-    def get_plan_metadata(self, plan_path: Union[str, Path]) -> dict[str, Any]:
+    def calculate_blast_radius_from_changes(
+        self, resource_changes: list[dict[str, Any]]
+    ) -> BlastRadius:
+        """Calculate blast radius from already-extracted resource changes.
+
+        Use this when the changes have been parsed once already (e.g. by
+        extract_resource_changes) to avoid re-reading the plan file.
+
+        Args:
+            resource_changes: List of resource change dictionaries.
+
+        Returns:
+            BlastRadius object with calculated metrics.
+        """
+        return calculate_blast_radius(resource_changes, self.thresholds)
+
+    def get_plan_metadata(self, plan_path: Path) -> dict[str, Any]:
         """Extract metadata from plan file.
 
         Args:
@@ -159,47 +251,86 @@ class PlanIngestor:
         Returns:
             Dictionary with terraform_version, format_version, etc.
         """
-        plan_path = Path(plan_path)
-        metadata = {}
+        metadata: dict[str, Any] = {}
 
+        # ijson.kvitems would be tidier here but materializes every top-level
+        # value, including resource_changes; the raw event stream lets us
+        # match just the scalar keys and stop as soon as all are seen.
         with open(plan_path, "rb") as f:
-            # Extract specific fields using streaming
-            parser = ijson.parse(f)
-            for prefix, _event, value in parser:
-                if prefix == "terraform_version":
-                    metadata["terraform_version"] = value
-                elif prefix == "format_version":
-                    metadata["format_version"] = value
-                elif prefix == "timestamp":
-                    metadata["timestamp"] = value
-                elif prefix == "errored":
-                    metadata["errored"] = value
-
-                # Stop after we have the basic metadata
-                if len(metadata) >= 4:
-                    break
+            for prefix, _event, value in ijson.parse(f):
+                if prefix in _META_KEYS:
+                    metadata[prefix] = value
+                    if len(metadata) == len(_META_KEYS):
+                        break
 
         return metadata
 
 
+def ingest_plan_data(
+    plan: dict[str, Any],
+    thresholds: Optional[dict[str, int]] = None,
+) -> tuple[list[dict[str, Any]], BlastRadius, dict[str, Any]]:
+    """Ingest an already-parsed plan document.
+
+    Callers holding the plan as a dict (API integrations, callers that
+    parsed it themselves) can use this to skip the write-to-disk and
+    re-parse round trip that the path-based ingest_plan implies.
+
+    Args:
+        plan: Parsed Terraform plan dictionary.
+        thresholds: Optional blast radius thresholds.
+
+    Returns:
+        Tuple of (resource_changes, blast_radius, metadata).
+    """
+    ingestor = PlanIngestor(thresholds)
+    changes = plan.get("resource_changes", [])
+    metadata = {key: plan[key] for key in _META_KEYS if key in plan}
+    return changes, ingestor.calculate_blast_radius_from_changes(changes), metadata
+
+
 def ingest_plan(
     plan_path: Union[str, Path],
     thresholds: Optional[dict[str, int]] = None,
+    use_cache: bool = False,
 ) -> tuple[list[dict[str, Any]], BlastRadius, dict[str, Any]]:
     """Complete Phase 1: Ingest plan and calculate blast radius.
 
     Args:
         plan_path: Path to the Terraform plan JSON file.
         thresholds: Optional blast radius thresholds.
+        use_cache: Cache results under ~/.cache/tf-gate keyed by plan
+            content, so re-validating an unchanged plan skips parsing.
 
     Returns:
         Tuple of (resource_changes, blast_radius, metadata).
     """
     ingestor = PlanIngestor(thresholds)
 
-    # Extract all data
-    changes = ingestor.extract_resource_changes(plan_path)
-    blast_radius = ingestor.calculate_blast_radius(plan_path)
-    metadata = ingestor.get_plan_metadata(plan_path)
-
-    return changes, blast_radius, metadata
+    # Plans that fit comfortably in memory are parsed in one shot (C-level
+    # JSON parsing beats token-by-token streaming by a wide margin); only
+    # very large plans take the streaming path
+    plan_path = Path(plan_path)
+    cache_file: Optional[Path] = None
+    if plan_path.stat().st_size < ingestor.streaming_threshold:
+        plan_bytes = plan_path.read_bytes()
+
+        if use_cache:
+            key = _ingest_cache_key(plan_bytes, ingestor.thresholds)
+            cache_file = _INGEST_CACHE_DIR / f"{key}.pkl"
+            cached = _load_ingest_cache(cache_file)
+            if cached is not None:
+                return cached
+
+        doc = jsonio.loads(plan_bytes)
+        changes = doc.get("resource_changes", [])
+        metadata = {key: doc[key] for key in _META_KEYS if key in doc}
+    else:
+        changes, metadata = ingestor.parse_once(plan_path)
+
+    blast_radius = ingestor.calculate_blast_radius_from_changes(changes)
+
+    result = (changes, blast_radius, metadata)
+    if cache_file is not None:
+        _store_ingest_cache(cache_file, result)
+    return result
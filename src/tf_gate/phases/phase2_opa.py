@@ -6,6 +6,7 @@ This module integrates OPA policy evaluation into the validation pipeline.
 from pathlib import Path
 from typing import Any, Optional, Union
 
+from tf_gate.utils.blast_radius import BlastRadius
 from tf_gate.utils.opa import OPAClient, OPAPolicyError
 
 
@@ -30,11 +31,21 @@ class PolicyValidator:
             policy_dir: Directory containing .rego policy files.
             opa_binary: Optional path to OPA binary.
             strict_mode: If True, fail on any deny rule. If False, only fail on critical.
+
+        Raises:
+            PolicyValidationError: If the policies fail to compile.
         """
         self.policy_dir = Path(policy_dir)
         self.opa_client = OPAClient(binary_path=opa_binary)
         self.strict_mode = strict_mode
 
+        # Compile once up front so syntax errors surface immediately and the
+        # per-validation hot path is just the evaluation round trip
+        try:
+            self.opa_client.compile_policies(self.policy_dir)
+        except OPAPolicyError as e:
+            raise PolicyValidationError(f"Policy validation failed: {e}") from e
+
     def validate(
         self,
         resource_changes: list[dict[str, Any]],
@@ -56,31 +67,26 @@ class PolicyValidator:
         Raises:
             PolicyValidationError: If validation fails and strict_mode is enabled.
         """
-        # Prepare input data for OPA
+        # Prepare input data for OPA; one isinstance test replaces the
+        # per-field hasattr probes (each of which is a try/except inside)
+        if isinstance(blast_radius, BlastRadius):
+            br_dict = {
+                "level": blast_radius.level.value,
+                "total_resources": blast_radius.total_resources,
+                "delete_count": blast_radius.delete_count,
+                "replace_count": blast_radius.replace_count,
+            }
+        else:
+            br_dict = {
+                "level": blast_radius.get("level", "green"),
+                "total_resources": blast_radius.get("total_resources", 0),
+                "delete_count": blast_radius.get("delete_count", 0),
+                "replace_count": blast_radius.get("replace_count", 0),
+            }
+
         input_data = {
             "resource_changes": resource_changes,
-            "blast_radius": {
-                "level": (
-                    blast_radius.level.value
-                    if hasattr(blast_radius, "level")
-                    else blast_radius.get("level", "green")
-                ),
-                "total_resources": (
-                    blast_radius.total_resources
-                    if hasattr(blast_radius, "total_resources")
-                    else blast_radius.get("total_resources", 0)
-                ),
-                "delete_count": (
-                    blast_radius.delete_count
-                    if hasattr(blast_radius, "delete_count")
-                    else blast_radius.get("delete_count", 0)
-                ),
-                "replace_count": (
-                    blast_radius.replace_count
-                    if hasattr(blast_radius, "replace_count")
-                    else blast_radius.get("replace_count", 0)
-                ),
-            },
+            "blast_radius": br_dict,
             "terraform_version": metadata.get("terraform_version", "unknown"),
             "emergency_override": emergency_override,
             "timestamp": metadata.get("timestamp"),
@@ -88,10 +94,7 @@ class PolicyValidator:
         }
 
         try:
-            # Compile policies first to check for syntax errors
-            self.opa_client.compile_policies(self.policy_dir)
-
-            # Evaluate policies
+            # Evaluate policies; syntax errors were caught at construction
             results = self.opa_client.evaluate(
                 policy_dir=self.policy_dir,
                 input_data=input_data,
@@ -6,7 +6,7 @@ This module provides:
 - Provider version checking
 """
 
-import json
+import hashlib
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
@@ -14,6 +14,13 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Optional, Union
 
+from tf_gate.utils import jsonio
+
+# Parsed drift plans keyed by terraform dir -> (plan file digest, parsed
+# dict). When refresh-only produces a byte-identical drift.tfplan, the
+# `terraform show -json` subprocess and its JSON parse are both skipped.
+_drift_plan_cache: dict[str, tuple[str, dict[str, Any]]] = {}
+
 
 class RiskLevel(Enum):
     """Risk severity levels."""
@@ -28,6 +35,14 @@ class RiskLevel(Enum):
 class TemporalContext:
     """Temporal safety context."""
 
+    __slots__ = (
+        "current_time",
+        "is_weekend",
+        "is_after_hours",
+        "is_friday_afternoon",
+        "risk_level",
+    )
+
     current_time: datetime
     is_weekend: bool
     is_after_hours: bool
@@ -54,6 +69,8 @@ class TemporalContext:
 class DriftResult:
     """Drift detection result."""
 
+    __slots__ = ("has_drift", "drifted_resources", "conflict_resources")
+
     has_drift: bool
     drifted_resources: list[dict[str, Any]]
     conflict_resources: list[dict[str, Any]]
@@ -91,39 +108,49 @@ class ContextEngine:
         self.after_hours_start = after_hours_start
         self.after_hours_end = after_hours_end
 
+        # 168-slot (weekday*24 + hour) lookup built once from the
+        # constructor parameters: each entry holds the three time flags
+        # and their combined risk bump, so per-call analysis is a single
+        # index instead of re-deriving the comparison chain
+        table = []
+        for weekday in range(7):
+            for hour in range(24):
+                is_weekend = weekday >= 5  # Saturday=5, Sunday=6
+                is_friday_afternoon = weekday == 4 and hour >= friday_cutoff_hour
+                is_after_hours = hour >= after_hours_start or hour < after_hours_end
+                bump = (
+                    bool(is_weekend and weekend_blocking)
+                    + is_friday_afternoon
+                    + is_after_hours
+                )
+                table.append((is_weekend, is_after_hours, is_friday_afternoon, bump))
+        self._time_table = tuple(table)
+
     def analyze_temporal_context(
         self,
         base_risk: RiskLevel = RiskLevel.LOW,
+        now: Optional[datetime] = None,
     ) -> TemporalContext:
         """Analyze temporal context and calculate risk level.
 
         Args:
             base_risk: Starting risk level before temporal adjustments.
+            now: Evaluation time; defaults to the current time. Passing
+                it explicitly lets callers pin the clock (deterministic
+                tests, replaying a past decision) without patching.
 
         Returns:
             TemporalContext with risk assessment.
         """
-        now = datetime.now()
-
-        # Determine time factors
-        is_weekend = now.weekday() >= 5  # Saturday=5, Sunday=6
-        is_friday_afternoon = now.weekday() == 4 and now.hour >= self.friday_cutoff_hour
-        is_after_hours = now.hour >= self.after_hours_start or now.hour < self.after_hours_end
+        if now is None:
+            now = datetime.now()
 
-        # Calculate risk escalation
-        risk_value = base_risk.value
-
-        if self.weekend_blocking and is_weekend:
-            risk_value += 1
-
-        if is_friday_afternoon:
-            risk_value += 1
-
-        if is_after_hours:
-            risk_value += 1
-
-        # Cap at CRITICAL
-        risk_value = min(risk_value, 4)
+        # One table index replaces the weekend/Friday/after-hours
+        # comparison chain; the bump is precomputed with it
+        is_weekend, is_after_hours, is_friday_afternoon, bump = self._time_table[
+            now.weekday() * 24 + now.hour
+        ]
+        risk_value = min(base_risk.value + bump, 4)
 
         return TemporalContext(
             current_time=now,
@@ -151,44 +178,59 @@ class ContextEngine:
 
         try:
             # Run terraform plan -refresh-only
+            # Output is discarded, so capture raw bytes and skip the
+            # locale-aware decode of potentially large refresh output
             subprocess.run(
                 ["terraform", "plan", "-refresh-only", "-out=drift.tfplan", "-no-color"],
                 cwd=terraform_dir,
                 capture_output=True,
-                text=True,
                 timeout=300,
                 check=False,
             )
 
-            # Convert drift plan to JSON
-            show_result = subprocess.run(
-                ["terraform", "show", "-json", "drift.tfplan"],
-                cwd=terraform_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            if show_result.returncode != 0:
-                # If no drift plan exists or command fails, assume no drift
-                return DriftResult(
-                    has_drift=False,
-                    drifted_resources=[],
-                    conflict_resources=[],
+            # If refresh-only produced a byte-identical plan, reuse the
+            # parsed document instead of re-running `terraform show`
+            cache_key = str(terraform_dir)
+            digest = None
+            try:
+                digest = hashlib.sha256((terraform_dir / "drift.tfplan").read_bytes()).hexdigest()
+            except OSError:
+                pass
+
+            cached = _drift_plan_cache.get(cache_key)
+            if digest is not None and cached is not None and cached[0] == digest:
+                drift_plan = cached[1]
+            else:
+                # Convert drift plan to JSON; capture bytes so orjson can
+                # parse the output without an intermediate text decode
+                show_result = subprocess.run(
+                    ["terraform", "show", "-json", "drift.tfplan"],
+                    cwd=terraform_dir,
+                    capture_output=True,
+                    timeout=60,
                 )
 
-            drift_plan = json.loads(show_result.stdout)
+                if show_result.returncode != 0:
+                    # If no drift plan exists or command fails, assume no drift
+                    return DriftResult(
+                        has_drift=False,
+                        drifted_resources=[],
+                        conflict_resources=[],
+                    )
+
+                drift_plan = jsonio.loads(show_result.stdout)
+                if digest is not None:
+                    _drift_plan_cache[cache_key] = (digest, drift_plan)
             drift_changes = drift_plan.get("resource_changes", [])
 
             # Find resources with drift (changes detected by refresh-only)
             drifted_resources = []
             for resource in drift_changes:
-                actions = resource.get("change", {}).get("actions", [])
+                change = resource.get("change", {})
+                actions = change.get("actions", [])
                 if "update" in actions or "no-op" in actions:
                     # Check if there's a difference between before and after
-                    before = resource.get("change", {}).get("before", {})
-                    after = resource.get("change", {}).get("after", {})
-                    if before != after:
+                    if change.get("before", {}) != change.get("after", {}):
                         drifted_resources.append(resource)
 
             # Check for conflicts: resources that are both drifted and being modified
@@ -210,7 +252,7 @@ class ContextEngine:
                 drifted_resources=[],
                 conflict_resources=[],
             )
-        except (subprocess.SubprocessError, json.JSONDecodeError):
+        except (subprocess.SubprocessError, ValueError):
             # If drift detection fails, continue without drift info
             return DriftResult(
                 has_drift=False,
@@ -4,8 +4,21 @@ This module validates that the commit message semantically matches
 the actual infrastructure changes being made.
 """
 
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Resource types worth calling out as critical in the impact report
+CRITICAL_REPORT_TYPES = frozenset({
+    "aws_db_instance",
+    "aws_rds_cluster",
+    "aws_kms_key",
+    "aws_s3_bucket",
+    "aws_dynamodb_table",
+    "aws_elasticache_cluster",
+})
 
 
 @dataclass
@@ -88,6 +101,9 @@ class IntentValidator:
         "iam": ["iam", "role", "policy", "permission"],
     }
 
+    # Persistent prompt cache location (shared across runs)
+    CACHE_PATH = Path.home() / ".cache" / "tf-gate" / "ai.json"
+
     def __init__(self, use_llm: bool = False, llm_provider: Optional[str] = None):
         """Initialize intent validator.
 
@@ -97,6 +113,9 @@ class IntentValidator:
         """
         self.use_llm = use_llm
         self.llm_provider = llm_provider
+        self._prompt_cache: Optional[dict[str, str]] = None
+        self._summary_src: Optional[list[dict[str, Any]]] = None
+        self._summary_cache = ""
 
     def validate(
         self,
@@ -114,29 +133,20 @@ class IntentValidator:
         Returns:
             IntentValidationResult with alignment status and optional report.
         """
-        # First try keyword-based validation
-        keyword_result = self._keyword_based_validation(commit_message, resource_changes)
-
         # If LLM is enabled, use it for better validation and optionally generate report
         if self.use_llm:
             try:
-                llm_result = self._llm_based_validation(commit_message, resource_changes)
-                
-                # Generate impact report if requested
                 if generate_report:
-                    try:
-                        report = self.generate_impact_report(commit_message, resource_changes)
-                        llm_result.report = report.to_markdown()
-                    except Exception as e:
-                        # Report generation failed, but validation succeeded
-                        llm_result.report = f"⚠️ Report generation failed: {e}"
-                
-                return llm_result
+                    # Single round trip: validation and report share the same
+                    # change context, so ask for both in one prompt instead of
+                    # two separate LLM calls
+                    return self._llm_validate_with_report(commit_message, resource_changes)
+                return self._llm_based_validation(commit_message, resource_changes)
             except Exception:
-                # Fall back to keyword result if LLM fails
+                # Fall back to keyword validation if LLM fails
                 pass
 
-        return keyword_result
+        return self._keyword_based_validation(commit_message, resource_changes)
 
     def _keyword_based_validation(
         self,
@@ -154,16 +164,18 @@ class IntentValidator:
         """
         commit_lower = commit_message.lower()
 
-        # Analyze actual changes
-        has_creations = any(
-            "create" in r.get("change", {}).get("actions", []) for r in resource_changes
-        )
-        has_deletions = any(
-            "delete" in r.get("change", {}).get("actions", []) for r in resource_changes
-        )
-        has_updates = any(
-            "update" in r.get("change", {}).get("actions", []) for r in resource_changes
-        )
+        # Analyze actual changes in a single pass instead of one scan per action
+        has_creations = has_deletions = has_updates = False
+        for r in resource_changes:
+            actions = r.get("change", {}).get("actions", [])
+            if "create" in actions:
+                has_creations = True
+            if "delete" in actions:
+                has_deletions = True
+            if "update" in actions:
+                has_updates = True
+            if has_creations and has_deletions and has_updates:
+                break
 
         # Check for mismatches
         mismatches = []
@@ -271,24 +283,75 @@ EXPLANATION: [2-3 sentence explanation]
 ACTION: [None|Review required|Human confirmation needed]
 """
 
-        if self.llm_provider == "ollama":
-            return self._call_ollama(prompt)
-        elif self.llm_provider == "openai":
-            return self._call_openai(prompt)
-        elif self.llm_provider == "lmstudio":
-            return self._call_lmstudio(prompt)
-        else:
-            raise NotImplementedError(f"LLM provider '{self.llm_provider}' not implemented")
+        response_text = self._cached_llm_call(prompt, self._fetch_llm_response)
+        return self._parse_llm_response(response_text)
+
+    def _llm_validate_with_report(
+        self,
+        commit_message: str,
+        resource_changes: list[dict[str, Any]],
+    ) -> IntentValidationResult:
+        """Validate intent and generate the impact report in one LLM call.
+
+        Running validation and report generation as separate calls resends
+        the same change summary twice; combining them into one prompt halves
+        the round trips and the prompt tokens.
+
+        Args:
+            commit_message: Git commit message.
+            resource_changes: List of resource changes.
+
+        Returns:
+            IntentValidationResult with the report attached.
+        """
+        change_summary = self._summarize_changes(resource_changes)
+
+        prompt = f"""Analyze the semantic alignment between a git commit message and Terraform infrastructure changes, then summarize the change for tech managers.
+
+Git Commit Message: "{commit_message}"
+
+Terraform Changes Summary:
+{change_summary}
+
+Respond in this exact format:
+ALIGNMENT: [ALIGNED|MISMATCH|UNCERTAIN]
+EXPLANATION: [2-3 sentence explanation]
+ACTION: [None|Review required|Human confirmation needed]
+SUMMARY: [25 words - executive summary of the change]
+CURRENT_STATE: [20 words - describe current infrastructure state]
+PROPOSED_CHANGES: [25 words - what will change]
+SYSTEM_IMPACT: [20 words - performance, availability, security impact]
+RISK_ASSESSMENT: [15 words - key risks]
+RECOMMENDATIONS: [15 words - specific recommendations]
+SAFETY_RATING: [ONE of: SAFE|CAUTION|RISKY|DANGEROUS]
+CONFIDENCE: [0-100]
+"""
+
+        response_text = self._cached_llm_call(prompt, self._fetch_llm_response)
+
+        result = self._parse_llm_response(response_text)
+        try:
+            result.report = self._parse_impact_report_response(response_text).to_markdown()
+        except Exception as e:
+            # Report parsing failed, but validation succeeded
+            result.report = f"⚠️ Report generation failed: {e}"
+        return result
 
     def _summarize_changes(self, resource_changes: list[dict[str, Any]]) -> str:
         """Create a human-readable summary of changes.
 
+        The summary for the most recent change list is memoized, so the
+        validation and report paths don't re-serialize the same changes.
+
         Args:
             resource_changes: List of resource changes.
 
         Returns:
             Summary string.
         """
+        if resource_changes is self._summary_src:
+            return self._summary_cache
+
         if not resource_changes:
             return "No changes"
 
@@ -305,96 +368,75 @@ ACTION: [None|Review required|Human confirmation needed]
         if len(resource_changes) > 20:
             summary_parts.append(f"  ... and {len(resource_changes) - 20} more resources")
 
-        return "\n".join(summary_parts)
+        self._summary_src = resource_changes
+        self._summary_cache = "\n".join(summary_parts)
+        return self._summary_cache
 
-    def _call_ollama(self, prompt: str) -> IntentValidationResult:
-        """Call Ollama LLM.
+    def _fetch_llm_response(self, prompt: str) -> str:
+        """Send a prompt to the configured LLM provider and return raw text.
 
         Args:
             prompt: Prompt text.
 
         Returns:
-            IntentValidationResult.
-        """
-        try:
-            import ollama
+            Raw LLM response text.
 
-            response = ollama.generate(
-                model="llama3",
-                prompt=prompt,
-            )
+        Raises:
+            NotImplementedError: If LLM provider not available.
+        """
+        fetch = self._PROVIDER_CALLS.get(self.llm_provider or "")
+        if fetch is None:
+            raise NotImplementedError(f"LLM provider '{self.llm_provider}' not implemented")
+        return fetch(self, prompt)
 
-            return self._parse_llm_response(response.get("response", ""))
-        except ImportError as e:
-            raise NotImplementedError("ollama package not installed") from e
+    def _cached_llm_call(self, prompt: str, fetch: Callable[[str], str]) -> str:
+        """Return a cached LLM response for a prompt, calling fetch on a miss.
 
-    def _call_openai(self, prompt: str) -> IntentValidationResult:
-        """Call OpenAI API.
+        Responses are keyed by SHA-256 of the prompt and persisted to
+        CACHE_PATH, so repeated analyses of an identical plan (CI reruns,
+        retries) skip the LLM round trip entirely.
 
         Args:
             prompt: Prompt text.
+            fetch: Function that performs the actual LLM call.
 
         Returns:
-            IntentValidationResult.
+            Raw LLM response text.
         """
-        try:
-            import openai
+        key = hashlib.sha256(prompt.encode()).hexdigest()
 
-            client = openai.OpenAI()
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are analyzing Terraform plan alignment with commit messages.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.1,
-            )
+        if self._prompt_cache is None:
+            self._prompt_cache = self._load_prompt_cache()
 
-            content = response.choices[0].message.content
-            if content is None:
-                content = "ALIGNMENT: MISMATCH\nCONFIDENCE: 50\nEXPLANATION: Could not parse LLM response\nACTION: Review required"
-            return self._parse_llm_response(content)
-        except ImportError as e:
-            raise NotImplementedError("openai package not installed") from e
+        cached = self._prompt_cache.get(key)
+        if cached is not None:
+            return cached
 
-    def _call_lmstudio(self, prompt: str) -> IntentValidationResult:
-        """Call LMStudio local LLM via OpenAI-compatible API.
-
-        Args:
-            prompt: Prompt text.
+        response = fetch(prompt)
+        if response:
+            self._prompt_cache[key] = response
+            self._save_prompt_cache()
+        return response
 
-        Returns:
-            IntentValidationResult.
-        """
+    def _load_prompt_cache(self) -> dict[str, str]:
+        """Load the persisted prompt cache, returning empty on any failure."""
         try:
-            import openai
-
-            client = openai.OpenAI(
-                base_url="http://localhost:1234/v1",
-                api_key="not-needed"  # LMStudio doesn't require an API key
-            )
-            response = client.chat.completions.create(
-                model="qwen2.5-coder-7b-instruct",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are analyzing Terraform plan alignment with commit messages.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.7,
-                max_tokens=-1,
-            )
-
-            content = response.choices[0].message.content
-            if content is None:
-                content = "ALIGNMENT: MISMATCH\nCONFIDENCE: 50\nEXPLANATION: Could not parse LLM response\nACTION: Review required"
-            return self._parse_llm_response(content)
-        except ImportError as e:
-            raise NotImplementedError("openai package not installed") from e
+            with open(self.CACHE_PATH) as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+        except (OSError, json.JSONDecodeError):
+            pass
+        return {}
+
+    def _save_prompt_cache(self) -> None:
+        """Persist the prompt cache to disk, ignoring write failures."""
+        try:
+            self.CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.CACHE_PATH, "w") as f:
+                json.dump(self._prompt_cache, f)
+        except OSError:
+            pass
 
     def _parse_llm_response(self, response: str) -> IntentValidationResult:
         """Parse LLM response into IntentValidationResult.
@@ -456,17 +498,22 @@ ACTION: [None|Review required|Human confirmation needed]
         """
         change_summary = self._summarize_changes(resource_changes)
 
-        # Calculate statistics
+        # Calculate statistics and identify critical resources in one pass
         total_resources = len(resource_changes)
-        create_count = sum(1 for r in resource_changes if "create" in r.get("change", {}).get("actions", []))
-        delete_count = sum(1 for r in resource_changes if "delete" in r.get("change", {}).get("actions", []))
-        update_count = sum(1 for r in resource_changes if "update" in r.get("change", {}).get("actions", []))
-        replace_count = sum(1 for r in resource_changes if set(r.get("change", {}).get("actions", [])) == {"create", "delete"})
-
-        # Identify critical resources
-        critical_types = {"aws_db_instance", "aws_rds_cluster", "aws_kms_key", "aws_s3_bucket", 
-                         "aws_dynamodb_table", "aws_elasticache_cluster"}
-        critical_changes = [r for r in resource_changes if r.get("type", "") in critical_types]
+        create_count = delete_count = update_count = replace_count = 0
+        critical_changes = []
+        for r in resource_changes:
+            actions = r.get("change", {}).get("actions", [])
+            if "create" in actions:
+                create_count += 1
+            if "delete" in actions:
+                delete_count += 1
+            if "create" in actions and "delete" in actions:
+                replace_count += 1
+            if "update" in actions:
+                update_count += 1
+            if r.get("type", "") in CRITICAL_REPORT_TYPES:
+                critical_changes.append(r)
 
         prompt = f"""You are an expert DevOps engineer and cloud architect. Analyze this Terraform infrastructure change plan and create a concise report for tech managers.
 
@@ -504,18 +551,11 @@ CONFIDENCE: [0-100]
 """
 
         # Get LLM response
-        if self.llm_provider == "ollama":
-            response_text = self._call_llm_raw(prompt, model="llama3")
-        elif self.llm_provider == "openai":
-            response_text = self._call_openai_raw(prompt)
-        elif self.llm_provider == "lmstudio":
-            response_text = self._call_lmstudio_raw(prompt)
-        else:
-            raise NotImplementedError(f"LLM provider '{self.llm_provider}' not implemented")
+        response_text = self._cached_llm_call(prompt, self._fetch_llm_response)
 
         return self._parse_impact_report_response(response_text)
 
-    def _call_llm_raw(self, prompt: str, model: str) -> str:
+    def _call_llm_raw(self, prompt: str, model: str = "llama3") -> str:
         """Call Ollama LLM and return raw response."""
         try:
             import ollama
@@ -565,6 +605,14 @@ CONFIDENCE: [0-100]
         except ImportError as e:
             raise NotImplementedError("openai package not installed") from e
 
+    # Provider dispatch table; fixed at class definition instead of an
+    # if/elif chain evaluated on every call
+    _PROVIDER_CALLS: dict[str, Callable[["IntentValidator", str], str]] = {
+        "ollama": _call_llm_raw,
+        "openai": _call_openai_raw,
+        "lmstudio": _call_lmstudio_raw,
+    }
+
     def _parse_impact_report_response(self, response: str) -> ChangeImpactReport:
         """Parse LLM response into ChangeImpactReport."""
         lines = response.strip().split("\n")
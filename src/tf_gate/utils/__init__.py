@@ -1,6 +1,10 @@
 """Utility modules for tf-gate."""
 
-from tf_gate.utils.blast_radius import BlastRadius, calculate_blast_radius
+from tf_gate.utils.blast_radius import (
+    BlastRadius,
+    calculate_blast_radius,
+    calculate_blast_radius_level,
+)
 from tf_gate.utils.config import Config, load_config
 from tf_gate.utils.git import get_git_info, get_latest_commit_message
 from tf_gate.utils.opa import OPAClient, get_default_policy_dir
@@ -8,6 +12,7 @@ from tf_gate.utils.opa import OPAClient, get_default_policy_dir
 __all__ = [
     "BlastRadius",
     "calculate_blast_radius",
+    "calculate_blast_radius_level",
     "Config",
     "load_config",
     "get_git_info",
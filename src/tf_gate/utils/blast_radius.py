@@ -1,5 +1,6 @@
 """Blast radius calculation utilities."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
@@ -17,6 +18,16 @@ class BlastRadiusLevel(Enum):
 class BlastRadius:
     """Blast radius calculation result."""
 
+    __slots__ = (
+        "level",
+        "total_resources",
+        "create_count",
+        "update_count",
+        "delete_count",
+        "replace_count",
+        "critical_resources",
+    )
+
     level: BlastRadiusLevel
     total_resources: int
     create_count: int
@@ -37,7 +48,7 @@ class BlastRadius:
 
 
 # Resource types considered critical/stateful
-CRITICAL_RESOURCE_TYPES = {
+CRITICAL_RESOURCE_TYPES = frozenset({
     "aws_db_instance",
     "aws_rds_cluster",
     "aws_kms_key",
@@ -58,17 +69,27 @@ CRITICAL_RESOURCE_TYPES = {
     "google_sql_database_instance",
     "google_storage_bucket",
     "google_kms_key_ring",
-}
+})
+
+# Actions that destroy or recreate a resource
+DESTRUCTIVE_ACTIONS = frozenset({"delete", "replace"})
+
+# Bit per action kind; "replace" shares the delete bit since both destroy
+_CREATE, _DELETE, _UPDATE = 1, 2, 4
+_ACTION_BITS = {"create": _CREATE, "delete": _DELETE, "replace": _DELETE, "update": _UPDATE}
 
 
 def calculate_blast_radius(
-    resource_changes: list[dict],
+    resource_changes: Iterable[dict],
     thresholds: Optional[dict[str, int]] = None,
 ) -> BlastRadius:
     """Calculate blast radius from resource changes.
 
+    Accepts any iterable, so callers with very large plans can feed the
+    ijson stream directly without materializing a list first.
+
     Args:
-        resource_changes: List of resource change dictionaries.
+        resource_changes: Iterable of resource change dictionaries.
         thresholds: Dictionary with green, yellow, red thresholds.
                    Defaults: green=5, yellow=20, red=50
 
@@ -81,28 +102,37 @@ def calculate_blast_radius(
     update_count = 0
     delete_count = 0
     replace_count = 0
-    total_resources = len(resource_changes)
+    total_resources = 0
     critical_resources = []
 
+    # Hoist loop invariants; locals are cheaper than globals per iteration
+    critical_types = CRITICAL_RESOURCE_TYPES
+    bits_get = _ACTION_BITS.get
+    critical_append = critical_resources.append
+
     for resource in resource_changes:
-        actions = resource.get("change", {}).get("actions", [])
-        resource_type = resource.get("type", "")
-        address = resource.get("address", "")
+        total_resources += 1
+        change = resource.get("change")
+        actions = change.get("actions", ()) if change else ()
+
+        # Fold actions into a bitmask, then classify with integer tests
+        # instead of repeated list membership scans
+        mask = 0
+        for a in actions:
+            mask |= bits_get(a, 0)
 
-        # Count by action type
-        if "create" in actions and "delete" in actions:
+        if mask & (_CREATE | _DELETE) == _CREATE | _DELETE:
             replace_count += 1
-        elif "create" in actions:
+        elif mask & _CREATE:
             create_count += 1
-        elif "delete" in actions:
+        elif mask & _DELETE:
             delete_count += 1
-        elif "update" in actions:
+        elif mask & _UPDATE:
             update_count += 1
 
-        # Track critical resources
-        if resource_type in CRITICAL_RESOURCE_TYPES:
-            if any(a in actions for a in ["delete", "replace"]):
-                critical_resources.append(address)
+        # Track critical resources; only resolve the address when needed
+        if mask & _DELETE and resource.get("type", "") in critical_types:
+            critical_append(resource.get("address", ""))
 
     # Determine level
     destructive_count = delete_count + replace_count
@@ -125,6 +155,54 @@ def calculate_blast_radius(
     )
 
 
+def calculate_blast_radius_level(
+    resource_changes: list[dict],
+    thresholds: Optional[dict[str, int]] = None,
+) -> BlastRadiusLevel:
+    """Determine just the blast radius level, short-circuiting when possible.
+
+    Callers that only gate on the level (not the exact counts) can stop as
+    soon as RED is provably reached: total resources hit the red threshold,
+    more than 5 destructive changes, or any critical resource destroyed.
+
+    Args:
+        resource_changes: List of resource change dictionaries.
+        thresholds: Dictionary with green, yellow, red thresholds.
+                   Defaults: green=5, yellow=20, red=50
+
+    Returns:
+        BlastRadiusLevel for the changes.
+    """
+    thresholds = thresholds or {"green": 5, "yellow": 20, "red": 50}
+
+    total_resources = len(resource_changes)
+    if total_resources >= thresholds["red"]:
+        return BlastRadiusLevel.RED
+
+    destructive_count = 0
+    critical_types = CRITICAL_RESOURCE_TYPES
+    bits_get = _ACTION_BITS.get
+
+    for resource in resource_changes:
+        change = resource.get("change")
+        actions = change.get("actions", ()) if change else ()
+
+        mask = 0
+        for a in actions:
+            mask |= bits_get(a, 0)
+
+        if mask & _DELETE:
+            if resource.get("type", "") in critical_types:
+                return BlastRadiusLevel.RED
+            destructive_count += 1
+            if destructive_count > 5:
+                return BlastRadiusLevel.RED
+
+    if total_resources >= thresholds["yellow"] or destructive_count > 0:
+        return BlastRadiusLevel.YELLOW
+    return BlastRadiusLevel.GREEN
+
+
 def get_blast_radius_summary(blast_radius: BlastRadius) -> str:
     """Get a human-readable summary of blast radius.
 
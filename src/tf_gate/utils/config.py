@@ -1,10 +1,21 @@
 """Configuration management for tf-gate."""
 
+import copy
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union
 
 import yaml
 
+try:
+    # libyaml-backed loader/dumper; substantially faster than pure Python
+    from yaml import CSafeLoader as SafeLoader
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 DEFAULT_CONFIG = {
     "opa": {
         "policy_dir": "./policies",
@@ -34,6 +45,15 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Frozen defaults blob: pickle round trips beat copy.deepcopy severalfold
+# for plain dict trees, and Config() is constructed per CLI run and per
+# test case
+_DEFAULT_PICKLE = pickle.dumps(DEFAULT_CONFIG, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Parsed-YAML cache: path -> (mtime_ns, parsed dict). Entries are handed
+# out as deep copies so merged configs can't mutate the cache.
+_yaml_cache: dict[str, tuple[int, dict]] = {}
+
 
 class Config:
     """Configuration manager for tf-gate."""
@@ -44,7 +64,11 @@ class Config:
         Args:
             config_path: Path to configuration file. If None, uses defaults.
         """
-        self._config = DEFAULT_CONFIG.copy()
+        # Materialized from the pickled blob: isolates each instance from
+        # DEFAULT_CONFIG (a shallow copy would alias the nested sections)
+        # at a fraction of copy.deepcopy's cost
+        self._config = pickle.loads(_DEFAULT_PICKLE)
+        self._flat: Optional[dict[str, Any]] = None
 
         if config_path:
             self.load_from_file(config_path)
@@ -57,14 +81,24 @@ class Config:
         """
         config_path = Path(config_path)
 
-        if not config_path.exists():
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError:
             return
 
-        with open(config_path) as f:
-            user_config = yaml.safe_load(f)
+        key = str(config_path)
+        cached = _yaml_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            user_config = copy.deepcopy(cached[1])
+        else:
+            with open(config_path) as f:
+                user_config = yaml.load(f, Loader=SafeLoader)
+            if isinstance(user_config, dict):
+                _yaml_cache[key] = (mtime_ns, copy.deepcopy(user_config))
 
         if user_config:
             self._merge_config(user_config)
+            self._flat = None
 
     def _merge_config(self, user_config: dict[str, Any]) -> None:
         """Merge user config with defaults.
@@ -83,10 +117,27 @@ class Config:
 
         merge_dict(self._config, user_config)
 
+    def _flatten(self) -> dict[str, Any]:
+        """Build the dotted-path lookup table for every node in the tree."""
+        flat: dict[str, Any] = {}
+
+        def walk(prefix: str, node: dict[str, Any]) -> None:
+            for k, v in node.items():
+                path = f"{prefix}.{k}" if prefix else k
+                flat[path] = v
+                if isinstance(v, dict):
+                    walk(path, v)
+
+        walk("", self._config)
+        return flat
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key.
 
         Supports dot notation for nested keys (e.g., "opa.policy_dir").
+        Lookups hit a flattened path table built lazily after each
+        mutation, so a get is one dict probe instead of a split plus a
+        descent through the nesting.
 
         Args:
             key: Configuration key.
@@ -95,16 +146,11 @@ class Config:
         Returns:
             Configuration value or default.
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        flat = self._flat
+        if flat is None:
+            flat = self._flat = self._flatten()
 
-        return value
+        return flat.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value by key.
@@ -122,6 +168,7 @@ class Config:
             config = config[k]
 
         config[keys[-1]] = value
+        self._flat = None
 
     def to_dict(self) -> dict[str, Any]:
         """Return configuration as dictionary.
@@ -140,12 +187,37 @@ class Config:
         config_path = Path(config_path)
 
         with open(config_path, "w") as f:
-            yaml.dump(self._config, f, default_flow_style=False)
+            yaml.dump(self._config, f, Dumper=SafeDumper, default_flow_style=False)
+
+
+@lru_cache(maxsize=32)
+def _find_config_file_cached(resolved_start: str) -> Optional[Path]:
+    """Walk up from a resolved directory looking for a config file."""
+    config_names = ["tf-gate.yaml", "tf-gate.yml", ".tf-gate.yaml", ".tf-gate.yml"]
+
+    current = Path(resolved_start)
+
+    while True:
+        for config_name in config_names:
+            config_path = current / config_name
+            if config_path.exists():
+                return config_path
+
+        # Check if we've reached the root
+        if current.parent == current:
+            break
+
+        current = current.parent
+
+    return None
 
 
 def find_config_file(start_dir: Optional[Path] = None) -> Optional[Path]:
     """Find configuration file in current directory or parents.
 
+    The upward walk is memoized per starting directory for the life of
+    the process.
+
     Args:
         start_dir: Directory to start searching from. Defaults to current directory.
 
@@ -155,40 +227,45 @@ def find_config_file(start_dir: Optional[Path] = None) -> Optional[Path]:
     if start_dir is None:
         start_dir = Path.cwd()
 
-    config_names = ["tf-gate.yaml", "tf-gate.yml", ".tf-gate.yaml", ".tf-gate.yml"]
+    return _find_config_file_cached(str(start_dir.resolve()))
 
-    current = start_dir.resolve()
 
-    while True:
-        for config_name in config_names:
-            config_path = current / config_name
-            if config_path.exists():
-                return config_path
+@lru_cache(maxsize=8)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> Config:
+    """Build a Config for a file, cached on path and mtime.
 
-        # Check if we've reached the root
-        if current.parent == current:
-            break
+    The mtime key invalidates the entry when the file changes; repeated
+    loads of an unchanged file (subcommands, test suites) share one parse.
 
-        current = current.parent
+    Args:
+        resolved_path: Resolved config file path.
+        mtime_ns: File modification time in nanoseconds.
 
-    return None
+    Returns:
+        Config object (shared across callers with the same key).
+    """
+    return Config(resolved_path)
 
 
 def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     """Load configuration from file or use defaults.
 
+    Results for unchanged files are memoized, so repeated invocations in
+    the same process skip the file read and YAML parse.
+
     Args:
         config_path: Optional explicit config file path.
 
     Returns:
         Config object.
     """
-    if config_path:
-        return Config(config_path)
+    path = Path(config_path) if config_path else find_config_file()
+    if path is None:
+        return Config()
 
-    # Try to find config file
-    found_path = find_config_file()
-    if found_path:
-        return Config(found_path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return Config(path)
 
-    return Config()
+    return _load_config_cached(str(path.resolve()), mtime_ns)
@@ -1,5 +1,6 @@
 """Git utilities for extracting commit messages and repository info."""
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -11,26 +12,48 @@ class GitError(Exception):
     pass
 
 
+# Memoized repo checks: directory -> (.git/HEAD mtime_ns or None, result).
+# The mtime token invalidates the entry on ref changes; a stat is far
+# cheaper than the fork/exec the check would otherwise repeat.
+_repo_cache: dict[str, tuple[Optional[int], bool]] = {}
+
+
 def is_git_repo(directory: Path) -> bool:
     """Check if directory is a git repository.
 
+    Results are cached per directory, revalidated by the mtime of
+    .git/HEAD, so repeat callers skip the git subprocess.
+
     Args:
         directory: Directory to check.
 
     Returns:
         True if directory is a git repository.
     """
+    key = str(directory.resolve())
+    try:
+        token: Optional[int] = os.stat(directory / ".git" / "HEAD").st_mtime_ns
+    except OSError:
+        token = None
+
+    cached = _repo_cache.get(key)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
     try:
+        # Only the return code matters; don't decode the output
         result = subprocess.run(
             ["git", "rev-parse", "--git-dir"],
             cwd=directory,
             capture_output=True,
-            text=True,
             timeout=5,
         )
-        return result.returncode == 0
+        found = result.returncode == 0
     except (subprocess.SubprocessError, FileNotFoundError):
-        return False
+        found = False
+
+    _repo_cache[key] = (token, found)
+    return found
 
 
 def get_latest_commit_message(
@@ -207,9 +230,40 @@ def get_git_info(directory: Path) -> dict:
     Returns:
         Dictionary with git information.
     """
+    # One `git log` yields hash, ref names, and message together; asking
+    # the individual helpers would fork git seven times (each one also
+    # re-checks is_git_repo)
+    try:
+        result = subprocess.run(
+            ["git", "log", "-1", "--format=%H%n%D%n%B"],
+            cwd=directory,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        result = None
+
+    if result is None or result.returncode != 0:
+        # Not a repo, or a repo with no commits yet
+        return {
+            "is_git_repo": result is not None and is_git_repo(directory),
+            "head": None,
+            "branch": None,
+            "latest_commit": None,
+        }
+
+    head, _, rest = result.stdout.partition("\n")
+    refs, _, message = rest.partition("\n")
+
+    # %D looks like "HEAD -> main, origin/main"; no "HEAD ->" means detached
+    branch = None
+    if refs.startswith("HEAD -> "):
+        branch = refs[len("HEAD -> ") :].split(",", 1)[0].strip()
+
     return {
-        "is_git_repo": is_git_repo(directory),
-        "head": get_git_head(directory),
-        "branch": get_git_branch(directory),
-        "latest_commit": get_latest_commit_message(directory),
+        "is_git_repo": True,
+        "head": head.strip() or None,
+        "branch": branch,
+        "latest_commit": message.strip() or None,
     }
@@ -0,0 +1,61 @@
+"""JSON helpers with optional orjson acceleration.
+
+orjson parses and serializes several times faster than the stdlib json
+module on large documents such as Terraform plan files. It is an optional
+dependency (install the "perf" extra); when it is not available these
+helpers fall back to the stdlib with identical semantics for the subset
+of features used in tf-gate.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the perf extra
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document from str or bytes.
+
+    Args:
+        data: JSON document.
+
+    Returns:
+        Deserialized Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes.
+
+    Preferred for file writes and HTTP bodies: with orjson it skips the
+    str round trip entirely.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
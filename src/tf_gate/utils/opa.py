@@ -6,14 +6,48 @@ This module provides functionality to:
 - Download OPA if not present (optional)
 """
 
+import atexit
 import contextlib
+import functools
+import hashlib
 import json
 import os
+import shutil
+import socket
 import subprocess
-import tempfile
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional, Union
 
+import requests
+
+from tf_gate.utils import jsonio
+
+
+# On-disk cache of compiled policy bundles, content-addressed by policy
+# digest so entries never go stale (mirrors the ingest cache layout)
+_BUNDLE_CACHE_DIR = Path.home() / ".cache" / "tf-gate" / "bundles"
+
+
+def _has_rego(policy_path: Path) -> bool:
+    """Check whether a directory contains any .rego file.
+
+    Stops at the first match instead of materializing the whole glob
+    listing just to test emptiness.
+
+    Args:
+        policy_path: Directory to scan.
+
+    Returns:
+        True if at least one .rego file is present.
+    """
+    try:
+        with os.scandir(policy_path) as entries:
+            return any(e.name.endswith(".rego") and e.is_file() for e in entries)
+    except OSError:
+        return False
+
 
 class OPANotFoundError(Exception):
     """Raised when OPA binary is not found."""
@@ -30,10 +64,18 @@ class OPAPolicyError(Exception):
 class OPAClient:
     """Client for interacting with OPA (Open Policy Agent).
 
-    This client uses the system-installed OPA binary via subprocess calls.
-    It auto-detects the OPA binary from common locations or uses a provided path.
+    This client uses the system-installed OPA binary. Evaluation prefers a
+    long-lived `opa run --server` process (started lazily, reused across
+    calls) so the Rego bundle is parsed and compiled once rather than on
+    every evaluation; the one-shot `opa eval` CLI remains as a fallback.
     """
 
+    # How long to wait for the server's health endpoint after spawn
+    SERVER_STARTUP_TIMEOUT = 10.0
+
+    # Maximum number of memoized evaluation results
+    EVAL_CACHE_SIZE = 1024
+
     def __init__(self, binary_path: Optional[str] = None):
         """Initialize OPA client.
 
@@ -43,6 +85,17 @@ class OPAClient:
         Raises:
             OPANotFoundError: If OPA binary cannot be found.
         """
+        self._server: Optional[subprocess.Popen] = None
+        self._server_url: Optional[str] = None
+        self._server_policy_dir: Optional[Path] = None
+        self._session: Optional[requests.Session] = None
+
+        # Evaluation memoization: keyed by input hash + policy digest, so
+        # entries self-invalidate when any .rego file changes
+        self._eval_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._policy_digests: dict[Path, tuple[tuple, str]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
         if binary_path:
             # Validate the provided binary path
             if not self._validate_opa_binary(binary_path):
@@ -71,10 +124,10 @@ class OPAClient:
             True if binary is valid.
         """
         try:
+            # Only the return code matters; don't decode the output
             result = subprocess.run(
                 [binary_path, "version"],
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
             return result.returncode == 0
@@ -82,35 +135,12 @@ class OPAClient:
             return False
 
     def _find_opa_binary(self) -> Optional[str]:
-        """Find OPA binary in system PATH.
+        """Find OPA binary in system PATH or common install locations.
 
         Returns:
             Path to OPA binary or None if not found.
         """
-        # Check common locations
-        locations = [
-            "opa",
-            "/usr/local/bin/opa",
-            "/usr/bin/opa",
-            "/opt/opa/opa",
-            os.path.expanduser("~/.local/bin/opa"),
-            os.path.expanduser("~/bin/opa"),
-        ]
-
-        for location in locations:
-            try:
-                result = subprocess.run(
-                    [location, "version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    return location
-            except (subprocess.SubprocessError, FileNotFoundError):
-                continue
-
-        return None
+        return _find_opa_binary_cached()
 
     def check_version(self) -> str:
         """Get OPA version.
@@ -132,6 +162,178 @@ class OPAClient:
         except subprocess.CalledProcessError as e:
             raise OPAPolicyError(f"Failed to check OPA version: {e.stderr}") from e
 
+    def _policy_digest(self, policy_path: Path) -> str:
+        """Digest of all .rego files under a policy directory.
+
+        The digest is recomputed only when a file's path, size, or mtime
+        changes; otherwise the memoized value is returned.
+
+        Args:
+            policy_path: Directory containing .rego policy files.
+
+        Returns:
+            Hex digest of the policy bundle contents.
+        """
+        stats = tuple(
+            (str(p), s.st_size, s.st_mtime_ns)
+            for p in sorted(policy_path.rglob("*.rego"))
+            for s in (p.stat(),)
+        )
+
+        cached = self._policy_digests.get(policy_path)
+        if cached is not None and cached[0] == stats:
+            return cached[1]
+
+        hasher = hashlib.sha256()
+        for path_str, _size, _mtime in stats:
+            hasher.update(Path(path_str).read_bytes())
+        digest = hasher.hexdigest()
+        self._policy_digests[policy_path] = (stats, digest)
+        return digest
+
+    def _bundle_file(self, policy_path: Path) -> Optional[Path]:
+        """Cache location for the compiled bundle of a policy directory.
+
+        Args:
+            policy_path: Directory containing .rego policy files.
+
+        Returns:
+            Content-addressed bundle path, or None if the sources can't
+            be digested (e.g. a file disappeared mid-scan).
+        """
+        try:
+            digest = self._policy_digest(policy_path)
+        except OSError:
+            return None
+        return _BUNDLE_CACHE_DIR / f"{digest}.tar.gz"
+
+    def _eval_cache_key(
+        self, policy_path: Path, input_data: dict[str, Any], query: str
+    ) -> str:
+        """Cache key for an evaluation: canonical input + policy digest."""
+        canonical = json.dumps(input_data, sort_keys=True, separators=(",", ":"))
+        hasher = hashlib.blake2b(canonical.encode())
+        hasher.update(query.encode())
+        hasher.update(self._policy_digest(policy_path).encode())
+        return hasher.hexdigest()
+
+    def close(self) -> None:
+        """Shut down the OPA server process, if one was started."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._server is not None:
+            self._server.terminate()
+            with contextlib.suppress(subprocess.TimeoutExpired):
+                self._server.wait(timeout=5)
+            if self._server.poll() is None:
+                self._server.kill()
+            self._server = None
+            self._server_url = None
+            self._server_policy_dir = None
+
+    def _ensure_server(self, policy_path: Path) -> str:
+        """Start (or reuse) an OPA server loaded with the given policies.
+
+        Args:
+            policy_path: Directory containing .rego policy files.
+
+        Returns:
+            Base URL of the running server.
+
+        Raises:
+            OPAPolicyError: If the server fails to start.
+        """
+        if (
+            self._server is not None
+            and self._server.poll() is None
+            and self._server_policy_dir == policy_path
+        ):
+            return self._server_url  # type: ignore[return-value]
+
+        # Policy dir changed or server died; start fresh
+        self.close()
+
+        # Bind port 0 to let the OS pick a free port, then hand it to OPA
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        addr = f"127.0.0.1:{port}"
+        url = f"http://{addr}"
+
+        try:
+            self._server = subprocess.Popen(
+                [self.binary_path, "run", "--server", f"--addr={addr}", str(policy_path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise OPAPolicyError(f"Failed to start OPA server: {e}") from e
+
+        atexit.register(self.close)
+        self._session = requests.Session()
+
+        # Wait for the health endpoint before accepting queries
+        deadline = time.monotonic() + self.SERVER_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._server.poll() is not None:
+                break
+            try:
+                if self._session.get(f"{url}/health", timeout=1).status_code == 200:
+                    self._server_url = url
+                    self._server_policy_dir = policy_path
+                    return url
+            except requests.RequestException:
+                time.sleep(0.05)
+
+        self.close()
+        raise OPAPolicyError("OPA server did not become healthy in time")
+
+    def _evaluate_server(
+        self,
+        policy_path: Path,
+        input_data: dict[str, Any],
+        query: str,
+    ) -> dict[str, Any]:
+        """Evaluate via the OPA server's data API.
+
+        Args:
+            policy_path: Directory containing .rego policy files.
+            input_data: Input data to evaluate.
+            query: Rego query path (e.g. "data.terraform.analysis").
+
+        Returns:
+            Parsed results with deny, warn, and info messages.
+
+        Raises:
+            OPAPolicyError: If the request fails.
+        """
+        url = self._ensure_server(policy_path)
+        # "data.terraform.analysis" -> /v1/data/terraform/analysis
+        data_path = "/".join(query.split(".")[1:])
+
+        try:
+            # Serialize with orjson (when available) instead of requests'
+            # stdlib json path; plan inputs can run to tens of MB
+            response = self._session.post(  # type: ignore[union-attr]
+                f"{url}/v1/data/{data_path}",
+                data=jsonio.dumps_bytes({"input": input_data}),
+                headers={"Content-Type": "application/json"},
+                timeout=30,
+            )
+            response.raise_for_status()
+            document = response.json().get("result", {})
+        except (requests.RequestException, ValueError) as e:
+            raise OPAPolicyError(f"OPA server evaluation failed: {e}") from e
+
+        results: dict[str, Any] = {"deny": [], "warn": [], "info": []}
+        for rule in results:
+            messages = document.get(rule)
+            if isinstance(messages, list):
+                results[rule] = messages
+        return results
+
     def compile_policies(self, policy_dir: Union[str, Path]) -> bool:
         """Compile Rego policies to check for syntax errors.
 
@@ -149,23 +351,37 @@ class OPAClient:
         if not policy_path.exists():
             raise OPAPolicyError(f"Policy directory not found: {policy_dir}")
 
-        rego_files = list(policy_path.glob("*.rego"))
-        if not rego_files:
+        if not _has_rego(policy_path):
             raise OPAPolicyError(f"No .rego files found in {policy_dir}")
 
+        # Reuse the compiled bundle when the policies haven't changed:
+        # the digest key means an unchanged policy set skips `opa build`
+        # entirely on repeat runs
+        bundle_file = self._bundle_file(policy_path)
+        if bundle_file is not None and bundle_file.exists():
+            return True
+
         try:
-            # Build command to compile policies
+            # Build to the cache location so later evaluations can consume
+            # the pre-compiled bundle instead of re-parsing the sources
             cmd = [self.binary_path, "build", str(policy_path)]
-
+            if bundle_file is not None:
+                try:
+                    bundle_file.parent.mkdir(parents=True, exist_ok=True)
+                    cmd += ["-o", str(bundle_file)]
+                except OSError:
+                    bundle_file = None
+
+            # Capture bytes; stderr is only decoded if the build fails
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=30,
             )
 
             if result.returncode != 0:
-                raise OPAPolicyError(f"Policy compilation failed: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", "replace")
+                raise OPAPolicyError(f"Policy compilation failed: {stderr}")
 
             return True
 
@@ -198,48 +414,131 @@ class OPAClient:
         if not policy_path.exists():
             raise OPAPolicyError(f"Policy directory not found: {policy_dir}")
 
-        # Create temporary input file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(input_data, f)
-            input_file = f.name
+        # Identical input against unchanged policies yields the same result;
+        # common in CI retries and repeat validations of one plan
+        try:
+            cache_key = self._eval_cache_key(policy_path, input_data, query)
+        except (OSError, TypeError, ValueError):
+            cache_key = None
+        if cache_key is not None:
+            cached = self._eval_cache.get(cache_key)
+            if cached is not None:
+                self.cache_hits += 1
+                self._eval_cache.move_to_end(cache_key)
+                return dict(cached)
+            self.cache_misses += 1
+
+        # Prefer the persistent server: policies are compiled once at server
+        # start, so repeat evaluations skip Rego parsing entirely. Fall back
+        # to one-shot `opa eval` if the server can't be started.
+        try:
+            results = self._evaluate_server(policy_path, input_data, query)
+        except OPAPolicyError:
+            if self._server is not None:
+                raise
+            results = self._evaluate_cli(policy_path, input_data, query)
+
+        if cache_key is not None:
+            self._eval_cache[cache_key] = dict(results)
+            if len(self._eval_cache) > self.EVAL_CACHE_SIZE:
+                self._eval_cache.popitem(last=False)
+        return results
+
+    def evaluate_batch(
+        self,
+        policy_dir: Union[str, Path],
+        inputs: list[dict[str, Any]],
+        query: str = "data.terraform.analysis",
+    ) -> list[dict[str, Any]]:
+        """Evaluate policies against several inputs in one pass.
+
+        The first evaluation pays the server spawn (or bundle compile);
+        the rest reuse the warm server and pooled HTTP session, so a
+        batch costs one startup rather than one per input. Results come
+        back in input order, and repeated inputs within the batch are
+        served from the evaluation cache.
+
+        Args:
+            policy_dir: Directory containing .rego policy files.
+            inputs: Input documents to evaluate, one result each.
+            query: Rego query path to evaluate.
+
+        Returns:
+            List of evaluation result dictionaries, in input order.
+
+        Raises:
+            OPAPolicyError: If any evaluation fails.
+        """
+        return [self.evaluate(policy_dir, input_data, query) for input_data in inputs]
+
+    def _evaluate_cli(
+        self,
+        policy_path: Path,
+        input_data: dict[str, Any],
+        query: str,
+    ) -> dict[str, Any]:
+        """Evaluate via a one-shot `opa eval` subprocess.
+
+        Args:
+            policy_path: Directory containing .rego policy files.
+            input_data: Input data to evaluate.
+            query: Rego query path to evaluate.
+
+        Returns:
+            Dictionary containing evaluation results (deny, warn, etc.).
+
+        Raises:
+            OPAPolicyError: If evaluation fails.
+        """
+        # Serialize up front, then pipe the input over stdin: no tempfile
+        # write/read/unlink round trip through the filesystem per call
+        payload = jsonio.dumps_bytes(input_data)
 
         try:
-            # Run OPA evaluation
+            # Prefer the pre-compiled bundle (written by compile_policies)
+            # so opa loads a parsed artifact instead of raw .rego sources
+            bundle_file = self._bundle_file(policy_path)
+            if bundle_file is not None and bundle_file.exists():
+                data_args = ["--bundle", str(bundle_file)]
+            else:
+                data_args = ["--data", str(policy_path)]
+
+            # Run OPA evaluation; pin the machine-readable output format
+            # rather than relying on opa's default staying json
             cmd = [
                 self.binary_path,
                 "eval",
-                "--data",
-                str(policy_path),
-                "--input",
-                input_file,
+                "--format=json",
+                "--stdin-input",
+                *data_args,
                 query,
             ]
 
+            # Capture raw bytes: the JSON output is handed straight to
+            # jsonio (orjson parses bytes natively), and stderr is only
+            # decoded on the error path
             result = subprocess.run(
                 cmd,
+                input=payload,
                 capture_output=True,
-                text=True,
                 timeout=30,
             )
 
             if result.returncode != 0:
-                raise OPAPolicyError(f"Policy evaluation failed: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", "replace")
+                raise OPAPolicyError(f"Policy evaluation failed: {stderr}")
 
             # Parse output
             try:
-                output = json.loads(result.stdout)
+                output = jsonio.loads(result.stdout)
                 return self._parse_eval_output(output)
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 raise OPAPolicyError(f"Failed to parse OPA output: {e}") from e
 
         except subprocess.TimeoutExpired as e:
             raise OPAPolicyError("Policy evaluation timed out") from e
         except subprocess.SubprocessError as e:
             raise OPAPolicyError(f"Failed to evaluate policies: {e}") from e
-        finally:
-            # Cleanup temporary file
-            with contextlib.suppress(OSError):
-                os.unlink(input_file)
 
     def _parse_eval_output(self, output: dict[str, Any]) -> dict[str, Any]:
         """Parse OPA eval output into structured format.
@@ -256,34 +555,78 @@ class OPAClient:
             "info": [],
         }
 
-        # Extract results from OPA output
-        if "result" in output and len(output["result"]) > 0:
-            result = output["result"][0]
+        # Walk down to the value document once; the old per-rule lookups
+        # re-traversed result -> expressions -> value for every rule and
+        # allocated sentinel [{}]/{} objects on each probe
+        result_list = output.get("result")
+        if not result_list:
+            return results
 
-            # Extract deny rules
-            if "deny" in result.get("expressions", [{}])[0].get("value", {}):
-                deny_msgs = result["expressions"][0]["value"]["deny"]
-                if isinstance(deny_msgs, list):
-                    results["deny"] = deny_msgs
+        expressions = result_list[0].get("expressions")
+        if not expressions:
+            return results
 
-            # Extract warn rules
-            if "warn" in result.get("expressions", [{}])[0].get("value", {}):
-                warn_msgs = result["expressions"][0]["value"]["warn"]
-                if isinstance(warn_msgs, list):
-                    results["warn"] = warn_msgs
+        value = expressions[0].get("value")
+        if not isinstance(value, dict):
+            return results
 
-            # Extract info rules
-            if "info" in result.get("expressions", [{}])[0].get("value", {}):
-                info_msgs = result["expressions"][0]["value"]["info"]
-                if isinstance(info_msgs, list):
-                    results["info"] = info_msgs
+        for rule in results:
+            messages = value.get(rule)
+            if isinstance(messages, list):
+                results[rule] = messages
 
         return results
 
 
+@functools.cache
+def _find_opa_binary_cached() -> Optional[str]:
+    """Locate a working OPA binary, memoized for the process lifetime.
+
+    PATH lookup and executable-bit checks replace the old approach of
+    speculatively spawning `opa version` at every candidate location;
+    only the chosen candidate gets one version sanity check.
+
+    Returns:
+        Path to OPA binary or None if not found.
+    """
+    candidates = []
+    which = shutil.which("opa")
+    if which:
+        candidates.append(which)
+
+    # Common install locations not necessarily on PATH
+    candidates += [
+        "/usr/local/bin/opa",
+        "/usr/bin/opa",
+        "/opt/opa/opa",
+        os.path.expanduser("~/.local/bin/opa"),
+        os.path.expanduser("~/bin/opa"),
+    ]
+
+    for candidate in candidates:
+        if not (os.path.isfile(candidate) and os.access(candidate, os.X_OK)):
+            continue
+        try:
+            result = subprocess.run(
+                [candidate, "version"],
+                capture_output=True,
+                timeout=5,
+            )
+            if result.returncode == 0:
+                return candidate
+        except (subprocess.SubprocessError, FileNotFoundError):
+            continue
+
+    return None
+
+
+@functools.cache
 def get_default_policy_dir() -> Path:
     """Get the default policy directory path.
 
+    The result is memoized: the packaged location doesn't move within a
+    process, so repeat callers skip the filesystem check.
+
     Returns:
         Path to default policies directory.
     """